@@ -1,18 +1,25 @@
+import io
 import os
-import tempfile
-import textwrap
 import json
+import hashlib
+import tempfile
+import threading
+import time
 from datetime import datetime
+from xml.sax.saxutils import escape
 
 import streamlit as st
 from openai import OpenAI
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from pydantic import BaseModel
 
 # ReportLab imports for PDF creation
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
 from reportlab.lib import colors
+from reportlab.pdfbase import pdfmetrics
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Frame, Paragraph
 
 # ---------------------------------------
 # Streamlit page config
@@ -26,69 +33,326 @@ st.title("🧾 Generate presentation-style HTML and export to PDF")
 OPENAI_API_KEY = st.secrets.get("OPENAI_API_KEY") if hasattr(st, "secrets") else os.environ.get("OPENAI_API_KEY")
 if not OPENAI_API_KEY:
     st.warning("Set OPENAI_API_KEY in Streamlit secrets or as an environment variable to enable HTML generation.")
-client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
 
-# Optional Jinja2 environment (unused but kept)
-env = Environment(loader=FileSystemLoader("."), autoescape=select_autoescape())
+# Streamlit re-runs this script on every interaction; build the client once per process and key
+@st.cache_resource
+def get_openai(api_key):
+    return OpenAI(api_key=api_key) if api_key else None
+
+client = get_openai(OPENAI_API_KEY)
 
 # ---------------------------------------
 # ReportLab PDF creation function
 # ---------------------------------------
-def create_pdf(title, slides, pdf_path):
-    c = canvas.Canvas(pdf_path, pagesize=A4)
+HELV = "Helvetica"
+HELV_BOLD = "Helvetica-Bold"
+TITLE_COLOR = colors.darkblue
+BULLET_STYLE = ParagraphStyle("SlideBullet", fontName=HELV, fontSize=12, leading=14, spaceAfter=4)
+
+# Load the font metrics once at import instead of on the first export
+for _font_name in (HELV, HELV_BOLD):
+    pdfmetrics.getFont(_font_name)
+
+def wrap_by_width(text, font, size, max_width):
+    """Greedily pack words into lines no wider than `max_width` points."""
+    lines = []
+    line = ""
+    for word in str(text).split():
+        candidate = f"{line} {word}" if line else word
+        if line and pdfmetrics.stringWidth(candidate, font, size) > max_width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return lines or [""]
+
+def _bullet_frame(top, width):
+    """Frame from `top` down to the 1-inch bottom margin, between the side margins."""
+    return Frame(
+        1 * inch, 1 * inch, width - 2 * inch, top - 1 * inch,
+        leftPadding=0, rightPadding=0, topPadding=0, bottomPadding=0,
+    )
+
+def create_pdf(title, slides) -> bytes:
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4, invariant=True, pageCompression=1)
     width, height = A4
 
     # Title page
-    c.setFont("Helvetica-Bold", 24)
-    c.drawCentredString(width / 2, height - 2 * inch, title)
-    c.setFont("Helvetica", 12)
-    c.drawCentredString(width / 2, height - 2.5 * inch, "Generated Presentation")
+    c.setFont(HELV_BOLD, 24)
+    y = height - 2 * inch
+    for line in wrap_by_width(title, HELV_BOLD, 24, width - 2 * inch):
+        c.drawCentredString(width / 2, y, line)
+        y -= 30
+    c.setFont(HELV, 12)
+    c.drawCentredString(width / 2, y + 30 - 0.5 * inch, "Generated Presentation")
     c.showPage()
 
     # Slide pages
     for slide in slides:
-        c.setFont("Helvetica-Bold", 18)
-        c.setFillColor(colors.darkblue)
-        c.drawString(1 * inch, height - 1.2 * inch, slide.get("title", "Untitled Slide"))
-
-        c.setFont("Helvetica", 12)
-        c.setFillColor(colors.black)
-
-        y = height - 1.8 * inch
-        bullets = slide.get("bullets", [])
-        for bullet in bullets:
-            wrapped = textwrap.wrap(f"• {bullet}", width=90)
-            for line in wrapped:
-                c.drawString(1 * inch, y, line)
-                y -= 14
-            y -= 4
+        c.setFont(HELV_BOLD, 18)
+        c.setFillColor(TITLE_COLOR)
+        y = height - 1.2 * inch
+        for line in wrap_by_width(slide.get("title", "Untitled Slide"), HELV_BOLD, 18, width - 2 * inch):
+            c.drawString(1 * inch, y, line)
+            y -= 22
+
+        # Paragraph measures and wraps each bullet to the real text width
+        bullets = [Paragraph(f"• {escape(str(bullet))}", BULLET_STYLE) for bullet in slide.get("bullets", [])]
+        top = y + 22 - 0.6 * inch + BULLET_STYLE.leading
+        _bullet_frame(top, width).addFromList(bullets, c)
+
+        # addFromList leaves whatever did not fit in `bullets`; continue on new pages
+        while bullets:
+            c.showPage()
+            remaining = len(bullets)
+            _bullet_frame(height - 1 * inch, width).addFromList(bullets, c)
+            if len(bullets) == remaining:
+                # A single bullet taller than a whole page; split it across pages
+                bullets[:1] = bullets[0].split(width - 2 * inch, height - 2 * inch)
 
         c.showPage()
 
     c.save()
+    return buffer.getvalue()
+
+# Content-addressed: Streamlit hashes the arguments, so re-exporting an identical deck
+# is a cache lookup. Kept in memory only; a render takes milliseconds, not worth disk.
+@st.cache_data(max_entries=32, show_spinner=False)
+def create_pdf_cached(title: str, slides_json: str) -> bytes:
+    return create_pdf(title, json.loads(slides_json))
 
 # ---------------------------------------
 # OpenAI HTML generator (presentation-focused)
 # ---------------------------------------
-def generate_html_with_openai(format_instructions: str, content_instructions: str) -> str:
-    if not client:
-        return "<!doctype html><html><head><meta charset='utf-8'><title>Missing API Key</title></head><body><h1>Missing OPENAI_API_KEY</h1></body></html>"
-
-    system_prompt = (
-        "You are an expert in HTML/CSS presentation design. Return a COMPLETE, self-contained HTML5 document "
-        "that looks like a polished slide deck:\n"
-        "- First slide: full-screen hero with large centered title, subtitle, and date.\n"
-        "- Alternating background colors for slides.\n"
-        "- Large bold headings (2.5rem+), system sans-serif font.\n"
-        "- Grid layouts or cards for metrics.\n"
-        "- Inline SVG icons where relevant.\n"
-        "- Use CSS variables in :root for --accent, --accent2, --bg, --text.\n"
-        "- Each slide prints as its own PDF page (use page-break-after: always; except last slide).\n"
-        "- No external assets, fonts, or scripts.\n"
-        "Return only the HTML."
+OPENAI_MODEL = "gpt-4o-2024-08-06"
+OPENAI_TEMPERATURE = 0.35
+
+# Kept as a module-level constant and sent first so the prompt prefix is
+# byte-identical across requests.
+SYSTEM_PROMPT = (
+    "You are an expert in HTML/CSS presentation design. Return a COMPLETE, self-contained HTML5 document "
+    "that looks like a polished slide deck:\n"
+    "- First slide: full-screen hero with large centered title, subtitle, and date.\n"
+    "- Alternating background colors for slides.\n"
+    "- Large bold headings (2.5rem+), system sans-serif font.\n"
+    "- Grid layouts or cards for metrics.\n"
+    "- Inline SVG icons where relevant.\n"
+    "- Use CSS variables in :root for --accent, --accent2, --bg, --text.\n"
+    "- Each slide prints as its own PDF page (use page-break-after: always; except last slide).\n"
+    "- No external assets, fonts, or scripts.\n"
+    "Also give a plain-text outline of the same deck: one entry per slide with its title and its key "
+    "points as short bullets.\n"
+    'Return a JSON object: {"html": "<complete HTML document>", "slides": [{"title": "...", "bullets": ["..."]}]}.'
+)
+
+# Appended to SYSTEM_PROMPT (never prepended) so batch requests keep the same prefix
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + (
+    "\n\nYou will be given several documents to produce, each introduced by its id. "
+    "Instead of a single object, return a JSON object of the form "
+    '{"docs": [{"id": "<document id>", "html": "...", "slides": [...]}, ...]} '
+    "with exactly one entry per requested id."
+)
+
+# These models are also the structured-output schema: the SDK derives the strict
+# JSON schema from them (text_format=...), so they must stay free of defaults
+class Slide(BaseModel):
+    title: str
+    bullets: list[str]
+
+class Presentation(BaseModel):
+    html: str
+    slides: list[Slide]
+
+class _BatchDoc(Presentation):
+    id: str
+
+class _Batch(BaseModel):
+    docs: list[_BatchDoc]
+
+# Validated OpenAI responses (JSON) are cached in memory (per process, LRU) and on
+# disk (across restarts). Both layers expire entries after RESPONSE_CACHE_TTL seconds.
+RESPONSE_CACHE_DIR = ".openai_cache"
+RESPONSE_MEMORY_CACHE_SIZE = 32
+RESPONSE_DISK_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 24 * 60 * 60
+
+# Minimum number of new characters before the streamed preview is redrawn
+STREAM_REDRAW_CHARS = 200
+
+# Shared by every session (each on its own thread), so all access goes through the lock.
+# The lock lives in cache_resource too: a plain module global is recreated on every rerun.
+@st.cache_resource
+def _response_memory_cache():
+    return threading.Lock(), {}
+
+def _response_cache_key(model: str, system_prompt: str, user_prompt: str, temperature: float, extra: dict) -> str:
+    payload = json.dumps(
+        {"model": model, "system": system_prompt, "user": user_prompt, "temperature": temperature, "extra": extra},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _response_cache_path(key: str) -> str:
+    return os.path.join(RESPONSE_CACHE_DIR, f"{key}.json")
+
+def _remember_response(key: str, text: str, created: float) -> None:
+    lock, memory = _response_memory_cache()
+    with lock:
+        memory.pop(key, None)
+        memory[key] = (created, text)
+        while len(memory) > RESPONSE_MEMORY_CACHE_SIZE:
+            memory.pop(next(iter(memory)), None)
+
+def _get_cached_response(key: str):
+    lock, memory = _response_memory_cache()
+    with lock:
+        entry = memory.pop(key, None)
+        if entry is not None and time.time() - entry[0] < RESPONSE_CACHE_TTL:
+            memory[key] = entry  # Re-insert as most recently used
+            return entry[1]
+
+    path = _response_cache_path(key)
+    try:
+        created = os.path.getmtime(path)
+        if time.time() - created >= RESPONSE_CACHE_TTL:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except OSError:
+        return None
+    _remember_response(key, text, created)
+    return text
+
+def _prune_disk_cache() -> None:
+    """Drop expired entries, then the oldest ones beyond RESPONSE_DISK_CACHE_SIZE."""
+    now = time.time()
+    entries = []
+    for name in os.listdir(RESPONSE_CACHE_DIR):
+        if name.endswith(".json"):
+            path = os.path.join(RESPONSE_CACHE_DIR, name)
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                pass
+    entries.sort(reverse=True)
+    for i, (created, path) in enumerate(entries):
+        if i >= RESPONSE_DISK_CACHE_SIZE or now - created >= RESPONSE_CACHE_TTL:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def _store_cached_response(key: str, text: str) -> None:
+    _remember_response(key, text, time.time())
+    try:
+        os.makedirs(RESPONSE_CACHE_DIR, exist_ok=True)
+        # Write to a temp file and rename it into place so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=RESPONSE_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, _response_cache_path(key))
+        except OSError:
+            os.remove(tmp_path)
+            raise
+        _prune_disk_cache()
+    except OSError:
+        pass  # Disk cache is best-effort
+
+def _stream_response(request: dict, placeholder):
+    """Stream the response into `placeholder` as it arrives and return the final response."""
+    buf = ""
+    shown = 0
+    with client.responses.stream(**request) as stream:
+        for event in stream:
+            if event.type == "response.output_text.delta":
+                buf += event.delta
+                # Redraw in chunks; every redraw resends the whole buffer
+                if len(buf) - shown >= STREAM_REDRAW_CHARS:
+                    placeholder.code(buf, language="json")
+                    shown = len(buf)
+        return stream.get_final_response()
+
+def _error_html(heading: str, title: str = "Error") -> str:
+    return f"<!doctype html><html><head><meta charset='utf-8'><title>{title}</title></head><body><h1>{heading}</h1></body></html>"
+
+def _response_text(resp):
+    text = getattr(resp, "output_text", None)
+    if text:
+        return text.strip()
+
+    # output_text is a convenience property, so it is not part of model_dump()
+    try:
+        data = resp.model_dump()
+        return "\n".join(
+            c.get("text", "")
+            for o in data.get("output") or []
+            if o.get("type") == "message"
+            for c in o.get("content") or []
+            if c.get("type") == "output_text"
+        ).strip()
+    except Exception:
+        return None
+
+def _cached_completion(system_prompt: str, user_prompt: str, output_model, force: bool = False, placeholder=None, **extra):
+    """Return the model output parsed into `output_model`, served from cache unless `force` is set.
+
+    Returns None if the response was incomplete or did not validate; only output
+    that validates is cached.
+    """
+    cache_key = _response_cache_key(
+        OPENAI_MODEL, system_prompt, user_prompt, OPENAI_TEMPERATURE, {"schema": output_model.model_json_schema(), **extra}
+    )
+    if not force:
+        cached = _get_cached_response(cache_key)
+        if cached:
+            try:
+                return output_model.model_validate_json(cached)
+            except ValueError:
+                pass  # Unreadable entry; regenerate and overwrite it
+
+    request = dict(
+        model=OPENAI_MODEL,
+        input=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        temperature=OPENAI_TEMPERATURE,
+        text_format=output_model,
+        **extra,
     )
 
-    user_prompt = f"""
+    try:
+        if placeholder is not None:
+            resp = _stream_response(request, placeholder)
+        else:
+            resp = client.responses.parse(**request)
+    except ValueError:
+        # The SDK validates text_format output itself and raises on truncated or invalid JSON
+        return None
+    except RuntimeError:
+        # get_final_response() raises when a stream ends in response.incomplete/failed
+        # (output-token limit, content filter, server error) instead of returning it
+        return None
+
+    # Only reachable on the non-streaming path, e.g. "incomplete" at the output-token limit
+    if getattr(resp, "status", None) != "completed":
+        return None
+
+    text = _response_text(resp)
+    try:
+        parsed = output_model.model_validate_json(text)
+    except (TypeError, ValueError):
+        return None
+    _store_cached_response(cache_key, text)
+    return parsed
+
+def _user_prompt(format_instructions: str, content_instructions: str) -> str:
+    return f"""
 Desired presentation format:
 {format_instructions}
 
@@ -96,32 +360,54 @@ Content to include:
 {content_instructions}
 """
 
-    resp = client.responses.create(
-        model="gpt-4o-2024-08-06",
-        input=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        temperature=0.35,
-        max_output_tokens=3000,
+def _error_presentation(heading: str, title: str = "Error") -> Presentation:
+    return Presentation(html=_error_html(heading, title=title), slides=[])
+
+def generate_presentation_with_openai(format_instructions: str, content_instructions: str, force: bool = False, placeholder=None) -> Presentation:
+    """Generate the deck HTML and its slide outline (used by the ReportLab export) in one request."""
+    if not client:
+        return _error_presentation("Missing OPENAI_API_KEY", title="Missing API Key")
+
+    user_prompt = _user_prompt(format_instructions, content_instructions)
+    presentation = _cached_completion(
+        SYSTEM_PROMPT, user_prompt, Presentation, force=force, placeholder=placeholder
     )
+    if presentation is None:
+        return _error_presentation("Failed to parse OpenAI response")
+    return presentation
+
+def generate_presentation_batch(specs: list, force: bool = False, placeholder=None) -> list:
+    """Generate one presentation per spec in a single OpenAI request.
+
+    Each spec is a dict with "id", "format" and "content" keys. The model returns
+    {"docs": [{"id": ..., "html": ..., "slides": [...]}, ...]}, so the system prompt
+    and request overhead are paid once instead of once per document. If the combined
+    reply does not fit in one response, each spec is requested on its own instead.
+    """
+    def generate_one(spec):
+        return generate_presentation_with_openai(spec["format"], spec["content"], force=force, placeholder=placeholder)
+
+    if len(specs) == 1:
+        return [generate_one(specs[0])]
+    if not client:
+        return [_error_presentation("Missing OPENAI_API_KEY", title="Missing API Key")] * len(specs)
 
-    text = getattr(resp, "output_text", None)
-    if text:
-        return text.strip()
+    user_prompt = "\n".join(
+        f"=== Document id: {spec['id']} ===\n{_user_prompt(spec['format'], spec['content'])}" for spec in specs
+    )
+    batch = _cached_completion(BATCH_SYSTEM_PROMPT, user_prompt, _Batch, force=force, placeholder=placeholder)
+    # None means the reply was invalid or incomplete (usually the combined docs hit the output limit)
+    docs = {doc.id: doc for doc in batch.docs} if batch is not None else {}
 
-    try:
-        parts = []
-        for out in getattr(resp, "output", []) or []:
-            if getattr(out, "type", None) == "output_text":
-                parts.append(getattr(out, "text", ""))
-        return "\n".join(parts).strip()
-    except Exception:
-        return "<!doctype html><html><head><meta charset='utf-8'><title>Error</title></head><body><h1>Failed to parse OpenAI response</h1></body></html>"
+    return [docs.get(spec["id"]) or generate_one(spec) for spec in specs]
 
 # ---------------------------------------
 # UI
 # ---------------------------------------
+# Decks above this size are only sent to the browser for preview on request. A gpt-4o
+# reply tops out around 50-65 KB of HTML, so this catches the heaviest decks.
+PREVIEW_MAX_CHARS = 40_000
+
 left, right = st.columns([1, 1])
 
 with left:
@@ -138,6 +424,9 @@ Footer: contact info + page number."""
     default_content = "Generate a weekly marketing performance presentation for 'Acme Co' covering website traffic, conversions, conversion rate, and top campaigns for the last 7 days. Include actionable insights."
     content_instructions = st.text_area("Content instructions", value=default_content, height=200)
 
+    # Every variant shares one reply, so keep the count small enough to fit its output limit
+    variant_count = st.number_input("Design variants", min_value=1, max_value=3, value=1, step=1)
+    force_regenerate = st.checkbox("Force regenerate (bypass cache)", value=False)
     generate_btn = st.button("Generate HTML with OpenAI", type="primary")
 
 with right:
@@ -149,51 +438,68 @@ with right:
             st.error("Missing OPENAI_API_KEY environment variable.")
         else:
             with st.spinner("Generating presentation HTML..."):
-                html_state = generate_html_with_openai(format_instructions, content_instructions)
+                stream_placeholder = st.empty()
+                if variant_count == 1:
+                    presentation = generate_presentation_with_openai(
+                        format_instructions, content_instructions, force=force_regenerate, placeholder=stream_placeholder
+                    )
+                    variants = [presentation]
+                else:
+                    specs = [
+                        {
+                            "id": f"variant-{i + 1}",
+                            "format": f"{format_instructions}\n(Variant {i + 1} of {variant_count}: use a distinct color palette and layout.)",
+                            "content": content_instructions,
+                        }
+                        for i in range(variant_count)
+                    ]
+                    variants = generate_presentation_batch(specs, force=force_regenerate, placeholder=stream_placeholder)
+                stream_placeholder.empty()
+                variants = [variant.model_dump() for variant in variants]
+                html_state = variants[0]["html"]
+                st.session_state["generated_variants"] = variants
                 st.session_state["generated_html"] = html_state
+                st.session_state["slides"] = variants[0]["slides"]
 
-    if html_state:
-        st.markdown("Preview (sanitized):")
-        try:
-            st.html(html_state, width="100%")
-        except Exception:
-            from streamlit.components.v1 import html as st_html
-            st_html(html_state, height=700, scrolling=True)
-
-        col1, col2 = st.columns(2)
-        with col1:
-            suggested_name = f"presentation_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
-            file_name = st.text_input("PDF file name", value=suggested_name)
-        with col2:
-            pass  # No emulate_media for WeasyPrint — it uses print media by default
-
-        # --- Optional: Export using ReportLab from JSON slide data ---
-        st.markdown("---")
-        st.subheader("Optional: Enter slide data for ReportLab PDF export")
-        slide_data_raw = st.text_area(
-            "Enter slides as JSON list, e.g.:\n"
-            '[{"title": "Slide 1", "bullets": ["Point 1", "Point 2"]}, {"title": "Slide 2", "bullets": ["Point A"]}]', 
-            height=150
+    variants = st.session_state.get("generated_variants", [])
+    if len(variants) > 1:
+        variant_index = st.radio(
+            "Variant", range(len(variants)), format_func=lambda i: f"Variant {i + 1}", horizontal=True
         )
+        html_state = variants[variant_index]["html"]
+        st.session_state["generated_html"] = html_state
+        st.session_state["slides"] = variants[variant_index]["slides"]
 
-        slides_for_pdf = []
-        if slide_data_raw.strip():
+    if html_state:
+        st.markdown("Preview (sanitized):")
+        show_preview = True
+        if len(html_state) > PREVIEW_MAX_CHARS:
+            # Keyed on the content so a newly generated deck starts hidden again
+            preview_fp = hashlib.md5(html_state.encode("utf-8")).hexdigest()
+            st.caption(f"Large deck ({len(html_state.encode('utf-8')) // 1024} KB); the full HTML is still used for export.")
+            show_preview = st.toggle("Show preview", value=False, key=f"show_preview_{preview_fp}")
+        if show_preview:
             try:
-                slides_for_pdf = json.loads(slide_data_raw)
-            except Exception as e:
-                st.error(f"Invalid JSON for slides: {e}")
+                st.html(html_state, width="100%")
+            except Exception:
+                from streamlit.components.v1 import html as st_html
+                st_html(html_state, height=700, scrolling=True)
+
+        suggested_name = f"presentation_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
+        file_name = st.text_input("PDF file name", value=suggested_name)
+
+        # --- Export using ReportLab from the slide outline generated with the HTML ---
+        st.markdown("---")
+        slides_for_pdf = st.session_state.get("slides", [])
+        default_title = slides_for_pdf[0]["title"] if slides_for_pdf else "Presentation"
+        pdf_title = st.text_input("PDF title", value=default_title)
 
         if st.button("Export to PDF (ReportLab)"):
             if not slides_for_pdf:
-                st.error("Please provide slide data in JSON format for ReportLab PDF export.")
+                st.error("No slide outline was generated for this deck. Regenerate it to enable ReportLab PDF export.")
             else:
                 try:
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmpf:
-                        tmp_path = tmpf.name
-                    create_pdf(file_name.replace(".pdf", ""), slides_for_pdf, tmp_path)
-
-                    with open(tmp_path, "rb") as f:
-                        pdf_bytes = f.read()
+                    pdf_bytes = create_pdf_cached(pdf_title, json.dumps(slides_for_pdf, sort_keys=True))
 
                     st.success("PDF generated.")
                     st.download_button(
@@ -204,12 +510,6 @@ with right:
                     )
                 except Exception as e:
                     st.error(f"Failed to render PDF: {e}")
-                finally:
-                    try:
-                        if os.path.exists(tmp_path):
-                            os.remove(tmp_path)
-                    except Exception:
-                        pass
 
     else:
         st.info("Generate HTML to see a preview and export to PDF.")